@@ -36,13 +36,24 @@ PIECE_FILES = {
 # time 10 minutes for each player
 TIMER_SECONDS = 10 * 60
 
+# AI strength profiles: search stops at whichever budget runs out first
+# (depth, nodes or seconds), so thinking time stays bounded on any machine.
+# "noise" adds a random +/- centipawn error to every evaluation.
+AI_LEVELS = {
+    "Easy": {"max_depth": 2, "node_limit": 2000, "time_limit": 0.5, "noise": 80},
+    "Medium": {"max_depth": 3, "node_limit": 20000, "time_limit": 1.5, "noise": 20},
+    "Hard": {"max_depth": 5, "node_limit": 100000, "time_limit": 3.0, "noise": 0},
+}
+DEFAULT_AI_LEVEL = "Medium"
+
 
 class ChessGame(tk.Frame):
-    def __init__(self, master, start_window, ai_mode=False, player_color="white"):
+    def __init__(self, master, start_window, ai_mode=False, player_color="white", ai_level=DEFAULT_AI_LEVEL):
         super().__init__(master)
         self.master = master
         self.start_window = start_window
         self.ai_mode = ai_mode
+        self.ai_level = ai_level
         self.player_color = player_color.lower()
         self.board = chess.Board()
         self.selected_piece = None
@@ -383,7 +394,7 @@ class ChessGame(tk.Frame):
         self.after(500, self._execute_ai_move)
 
     def _execute_ai_move(self):
-        _, move = minimax(self.board, 3, -float('inf'), float('inf'), self.board.turn == chess.WHITE)
+        move = find_best_move(self.board, AI_LEVELS[self.ai_level])
         if move:
             self.make_move(move)
         self.game_info.config(text="")
@@ -550,8 +561,36 @@ def evaluate_board(board):
     return value
 
 
-def minimax(board, depth, alpha, beta, maximizing):
+class SearchAborted(Exception):
+    pass
+
+
+class SearchBudget:
+    def __init__(self, node_limit, time_limit, noise=0):
+        self.node_limit = node_limit
+        self.deadline = time.monotonic() + time_limit
+        self.noise = noise
+        self.nodes = 0
+
+    def visit(self):
+        self.nodes += 1
+        if self.nodes > self.node_limit or time.monotonic() > self.deadline:
+            raise SearchAborted()
+
+    def evaluate(self, board):
+        value = evaluate_board(board)
+        if self.noise:
+            value += random.randint(-self.noise, self.noise)
+        return value
+
+
+def minimax(board, depth, alpha, beta, maximizing, budget=None):
+    if budget is not None:
+        budget.visit()
+
     if depth == 0 or board.is_game_over():
+        if budget is not None:
+            return budget.evaluate(board), None
         return evaluate_board(board), None
 
     best_move = None
@@ -560,7 +599,7 @@ def minimax(board, depth, alpha, beta, maximizing):
         max_eval = -float('inf')
         for move in board.legal_moves:
             board.push(move)
-            eval, _ = minimax(board, depth - 1, alpha, beta, False)
+            eval, _ = minimax(board, depth - 1, alpha, beta, False, budget)
             board.pop()
             if eval > max_eval:
                 max_eval = eval
@@ -573,7 +612,7 @@ def minimax(board, depth, alpha, beta, maximizing):
         min_eval = float('inf')
         for move in board.legal_moves:
             board.push(move)
-            eval, _ = minimax(board, depth - 1, alpha, beta, True)
+            eval, _ = minimax(board, depth - 1, alpha, beta, True, budget)
             board.pop()
             if eval < min_eval:
                 min_eval = eval
@@ -584,6 +623,30 @@ def minimax(board, depth, alpha, beta, maximizing):
         return min_eval, best_move
 
 
+def find_best_move(board, level):
+    # Iterative deepening: keep the move from the deepest search that
+    # finished before the node or time budget ran out
+    budget = SearchBudget(level["node_limit"], level["time_limit"], level["noise"])
+    search_board = board.copy()
+    best_move = None
+
+    for depth in range(1, level["max_depth"] + 1):
+        try:
+            _, move = minimax(search_board, depth, -float('inf'), float('inf'),
+                              board.turn == chess.WHITE, budget)
+        except SearchAborted:
+            break
+        if move:
+            best_move = move
+
+    if best_move is None:
+        legal_moves = list(board.legal_moves)
+        if legal_moves:
+            best_move = random.choice(legal_moves)
+
+    return best_move
+
+
 class StartWindow(tk.Frame):
     def __init__(self, master):
         super().__init__(master)
@@ -624,6 +687,22 @@ class StartWindow(tk.Frame):
                                 activebackground="#2C3E50", activeforeground="white")
             rb.pack(side=tk.LEFT, padx=5)
 
+        # AI difficulty selection
+        level_frame = tk.Frame(btn_frame, bg="#2C3E50")
+        level_frame.pack(fill=tk.X, pady=10)
+
+        tk.Label(level_frame, text="AI Level:", font=("Helvetica", 14),
+                 fg="white", bg="#2C3E50").pack(side=tk.LEFT, padx=10)
+
+        self.ai_level = tk.StringVar(value=DEFAULT_AI_LEVEL)
+
+        for level in AI_LEVELS:
+            rb = tk.Radiobutton(level_frame, text=level, variable=self.ai_level,
+                                value=level, font=("Helvetica", 12),
+                                fg="white", bg="#2C3E50", selectcolor="#2C3E50",
+                                activebackground="#2C3E50", activeforeground="white")
+            rb.pack(side=tk.LEFT, padx=5)
+
         tk.Button(btn_frame, text="Play With AI", command=self.play_ai,
                   width=20, font=("Helvetica", 14, "bold"),
                   bg="#3498DB", fg="white", activebackground="#2980B9",
@@ -650,8 +729,8 @@ class StartWindow(tk.Frame):
 
     def play_ai(self):
         self.pack_forget()
-        ChessGame(self.master, self, ai_mode=True, player_color=self.ai_color.get().lower()).pack(fill=tk.BOTH,
-                                                                                                  expand=True)
+        ChessGame(self.master, self, ai_mode=True, player_color=self.ai_color.get().lower(),
+                  ai_level=self.ai_level.get()).pack(fill=tk.BOTH, expand=True)
 
     def play_human(self):
         self.pack_forget()